@@ -1,9 +1,20 @@
+import math
 import sys
+from enum import IntEnum
 import pygame
-import numpy as np
 from time import time
 from pfd import AircraftState, PrimaryFlightDisplay
 
+# Numba is optional: without it (or with NUMBA_DISABLE_JIT=1) the flight
+# dynamics below simply run as plain Python.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ===============================
 # SCREEN & LAYOUT
 # ===============================
@@ -22,12 +33,37 @@ PITCH_DESCENT = -4.0
 ALT_CAPTURE_BAND = 80.0
 TURN_GAIN = 3.0
 MAX_TURN_RATE = 6.0
+SETTLE_EPS = 1e-4
+
+# ===============================
+# FLIGHT MODES
+# ===============================
+class Mode(IntEnum):
+    CLIMB = 0
+    DESCENT = 1
+    ALT_CAPTURE = 2
+    CRUISE = 3
+    ROLLS = 4
+
+MODE_BY_NAME = {m.name: m for m in Mode}
 
 # ===============================
 # INIT PYGAME
 # ===============================
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# Only the subsystems we use; pygame.init() would also probe the audio mixer
+pygame.display.init()
+pygame.font.init()
+# Only quit and clicks are handled; drop everything else at the SDL level
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
+try:
+    # Hardware-accelerated window synced to the display refresh
+    screen = pygame.display.set_mode(
+        (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1
+    )
+except pygame.error:
+    # vsync not available with this video driver
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF)
 pygame.display.set_caption("Primary Flight Display Simulator (Project CATC Student)")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("Arial", 20)
@@ -38,9 +74,14 @@ font = pygame.font.SysFont("Arial", 20)
 PFD = PrimaryFlightDisplay(
     (PFD_WIDTH, SCREEN_HEIGHT),
     masked=True,
-    max_fps=60
+    render_fps=60,
+    update_fps=120,
 )
 
+# Physics runs at a fixed step, independent of how often we render
+FIXED_DT = 1.0 / PFD.update_fps
+MAX_FRAME_DT = 0.25
+
 # ===============================
 # BUTTONS
 # ===============================
@@ -56,13 +97,60 @@ IAS_DN = pygame.Rect(PFD_WIDTH + 210, 560, 80, 40)
 TURN_UP = pygame.Rect(PFD_WIDTH + 100, 660, 90, 40)
 TURN_DN = pygame.Rect(PFD_WIDTH + 210, 660, 90, 40)
 
+# Everything clickable, hit-tested in one collidelist() call
+CLICK_TARGETS = MODES + ["ALT_UP", "ALT_DN", "IAS_UP", "IAS_DN", "TURN_UP", "TURN_DN"]
+click_rects = [buttons[m] for m in MODES] + [ALT_UP, ALT_DN, IAS_UP, IAS_DN, TURN_UP, TURN_DN]
+
+# ===============================
+# STATIC LABELS (RENDERED ONCE)
+# ===============================
+title_label = font.render("        FLIGHT MODES      ", True, (255, 255, 255)).convert_alpha()
+mode_labels = {m: font.render(m, True, (0, 0, 0)).convert_alpha() for m in MODES}
+mode_label_positions = {m: mode_labels[m].get_rect(center=buttons[m].center) for m in MODES}
+label_alt_up = font.render("ALT +100", True, (0, 0, 0)).convert_alpha()
+label_alt_dn = font.render("ALT -100", True, (0, 0, 0)).convert_alpha()
+label_ias_up = font.render("IAS +5", True, (0, 0, 0)).convert_alpha()
+label_ias_dn = font.render("IAS -5", True, (0, 0, 0)).convert_alpha()
+label_turn_up = font.render("TURN +", True, (0, 0, 0)).convert_alpha()
+label_turn_dn = font.render("TURN -", True, (0, 0, 0)).convert_alpha()
+
+# ===============================
+# STATIC PANEL (COMPOSITED ONCE)
+# ===============================
+panel_bg = pygame.Surface((PANEL_WIDTH, SCREEN_HEIGHT)).convert()
+panel_bg.fill((28, 28, 28))
+panel_bg.blit(title_label, (80, 50))
+
+def _panel_rect(rect):
+    # Screen rect -> panel_bg local rect
+    return rect.move(-PFD_WIDTH, 0)
+
+# ALT Knob
+pygame.draw.rect(panel_bg, (0,200,0), _panel_rect(ALT_UP), border_radius=8)
+pygame.draw.rect(panel_bg, (220,50,50), _panel_rect(ALT_DN), border_radius=8)
+panel_bg.blit(label_alt_up, _panel_rect(ALT_UP).move(5, 10))
+panel_bg.blit(label_alt_dn, _panel_rect(ALT_DN).move(5, 10))
+
+# IAS Knob
+pygame.draw.rect(panel_bg, (0,200,0), _panel_rect(IAS_UP), border_radius=8)
+pygame.draw.rect(panel_bg, (220,50,50), _panel_rect(IAS_DN), border_radius=8)
+panel_bg.blit(label_ias_up, _panel_rect(IAS_UP).move(5, 10))
+panel_bg.blit(label_ias_dn, _panel_rect(IAS_DN).move(5, 10))
+
+# Turn Knob
+pygame.draw.rect(panel_bg, (0,200,0), _panel_rect(TURN_UP), border_radius=8)
+pygame.draw.rect(panel_bg, (220,50,50), _panel_rect(TURN_DN), border_radius=8)
+panel_bg.blit(label_turn_up, _panel_rect(TURN_UP).move(10,10))
+panel_bg.blit(label_turn_dn, _panel_rect(TURN_DN).move(10,10))
+
 BANK_OPTIONS = [-65, -60, -45, -30, 0, 30, 45, 60, 65]
-bank_angle = 0
+bank_idx = BANK_OPTIONS.index(0)
+bank_angle = BANK_OPTIONS[bank_idx]
 
 # ===============================
 # STATE VARIABLES
 # ===============================
-mode = "CRUISE"
+mode = Mode.CRUISE
 prev_mode = mode
 t0 = time()
 
@@ -78,198 +166,242 @@ vspeed = 0.0
 
 g_factor = 1.0
 
+# Single state object, updated in place every rendered frame
+state = AircraftState(
+    pitch=pitch,
+    roll=roll,
+    airspeed=airspeed,
+    airspeed_cmd=IAS_CMD,
+    vspeed=vspeed,
+    altitude=altitude,
+    altitude_cmd=ALTITUDE_CMD,
+    heading=heading,
+    heading_cmd=None,
+    course=heading
+)
+
 # ===============================
 # HELPERS
 # ===============================
+@njit(inline="always")
 def smooth(v, t, r, dt):
     return v + (t - v) * r * dt
 
+@njit(inline="always")
+def settle(v, t, r, dt):
+    # smooth(), but snap onto the target once close enough so steady state stops changing
+    if abs(t - v) <= SETTLE_EPS:
+        return t
+    return smooth(v, t, r, dt)
+
+@njit(inline="always")
 def update_airspeed(ias, pitch, target, dt):
     return smooth(ias, target - pitch * 0.4, 0.8, dt)
 
+@njit(inline="always")
 def compute_g(bank):
-    return 1.0 / max(0.01, np.cos(np.radians(bank)))
-
-# ===============================
-# MAIN LOOP
-# ===============================
-running = True
-while running:
-    dt = clock.tick(60) / 1000
-    sim_time = time() - t0
-
-    # ---------------------------
-    # EVENTS
-    # ---------------------------
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            # Flight mode buttons
-            for m, rect in buttons.items():
-                if rect.collidepoint(event.pos):
-                    prev_mode = mode
-                    mode = m
-
-            # ALT knob
-            if ALT_UP.collidepoint(event.pos):
-                ALTITUDE_CMD += 100
-                if mode == "CRUISE":
-                    mode = "CLIMB"
-            if ALT_DN.collidepoint(event.pos):
-                ALTITUDE_CMD -= 100
-                if mode == "CRUISE":
-                    mode = "DESCENT"
-
-            # IAS knob
-            if IAS_UP.collidepoint(event.pos):
-                IAS_CMD += 5
-            if IAS_DN.collidepoint(event.pos):
-                IAS_CMD -= 5
-
-            # TURN knob
-            if TURN_UP.collidepoint(event.pos):
-                idx = BANK_OPTIONS.index(bank_angle)
-                if idx < len(BANK_OPTIONS) - 1:
-                    bank_angle = BANK_OPTIONS[idx + 1]
-            if TURN_DN.collidepoint(event.pos):
-                idx = BANK_OPTIONS.index(bank_angle)
-                if idx > 0:
-                    bank_angle = BANK_OPTIONS[idx - 1]
-
+    return 1.0 / max(0.01, math.cos(math.radians(bank)))
+
+@njit(cache=True)
+def step_dynamics(mode, roll, pitch, vspeed, altitude, airspeed, heading, g_factor,
+                  ias_cmd, altitude_cmd, bank_angle, dt):
+    # The smooth() calls stay as scalar updates: several targets depend on a
+    # value updated just before (airspeed on pitch, pitch on g_factor), and
+    # compiled they are already straight-line FMAs without array overhead.
     # ===============================
     # FLIGHT LOGIC
     # ===============================
-    if mode == "CLIMB":
+    if mode == Mode.CLIMB:
         roll = smooth(roll, 0.0, 2.0, dt)
         pitch = smooth(pitch, PITCH_CLIMB, 1.5, dt)
         vspeed = smooth(vspeed, VS_CLIMB, 1.5, dt)
         altitude += vspeed / 60 * dt
-        airspeed = update_airspeed(airspeed, pitch, IAS_CMD - 10, dt)
-        if altitude >= ALTITUDE_CMD - ALT_CAPTURE_BAND:
-            mode = "ALT_CAPTURE"
+        airspeed = update_airspeed(airspeed, pitch, ias_cmd - 10, dt)
+        if altitude >= altitude_cmd - ALT_CAPTURE_BAND:
+            mode = Mode.ALT_CAPTURE
 
-    elif mode == "DESCENT":
+    elif mode == Mode.DESCENT:
         roll = smooth(roll, 0.0, 2.0, dt)
         pitch = smooth(pitch, PITCH_DESCENT, 1.5, dt)
         vspeed = smooth(vspeed, VS_DESCENT, 1.5, dt)
         altitude += vspeed / 60 * dt
-        airspeed = update_airspeed(airspeed, pitch, IAS_CMD + 5, dt)
-        if altitude <= ALTITUDE_CMD + ALT_CAPTURE_BAND:
-            mode = "ALT_CAPTURE"
+        airspeed = update_airspeed(airspeed, pitch, ias_cmd + 5, dt)
+        if altitude <= altitude_cmd + ALT_CAPTURE_BAND:
+            mode = Mode.ALT_CAPTURE
 
-    elif mode == "ALT_CAPTURE":
+    elif mode == Mode.ALT_CAPTURE:
         roll = smooth(roll, 0.0, 2.5, dt)
-        error = ALTITUDE_CMD - altitude
-        vs_cmd = np.clip(error * 5.0, -500, 500)
+        error = altitude_cmd - altitude
+        vs_cmd = min(500.0, max(-500.0, error * 5.0))
         vspeed = smooth(vspeed, vs_cmd, 2.0, dt)
         pitch = smooth(pitch, vs_cmd / 150.0, 2.0, dt)
         altitude += vspeed / 25 * dt
-        airspeed = update_airspeed(airspeed, pitch, IAS_CMD, dt)
+        airspeed = update_airspeed(airspeed, pitch, ias_cmd, dt)
         if abs(error) < 5:
-            altitude = ALTITUDE_CMD
-            airspeed = IAS_CMD
+            altitude = altitude_cmd
+            airspeed = ias_cmd
             pitch = 0.0
             vspeed = 0.0
-            mode = "CRUISE"
+            mode = Mode.CRUISE
 
-    elif mode == "CRUISE":
-        roll = smooth(roll, 0.0, 3.0, dt)
-        pitch = smooth(pitch, 0.0, 3.0, dt)
-        vspeed = smooth(vspeed, 0.0, 3.0, dt)
-        airspeed = smooth(airspeed, IAS_CMD, 1.2, dt)
+    elif mode == Mode.CRUISE:
+        roll = settle(roll, 0.0, 3.0, dt)
+        pitch = settle(pitch, 0.0, 3.0, dt)
+        vspeed = settle(vspeed, 0.0, 3.0, dt)
+        airspeed = settle(airspeed, ias_cmd, 1.2, dt)
 
-    elif mode == "ROLLS":
+    elif mode == Mode.ROLLS:
         roll = smooth(roll, bank_angle, 1.5, dt)
         g_target = compute_g(abs(roll))
         g_factor = smooth(g_factor, g_target, 3.0, dt)
         pitch = smooth(pitch, 3 + (g_factor - 1) * 3, 1.5, dt)
-        airspeed = update_airspeed(airspeed, pitch, IAS_CMD - 5, dt)
+        airspeed = update_airspeed(airspeed, pitch, ias_cmd - 5, dt)
 
-    if mode != "ROLLS":
-        g_factor = smooth(g_factor, 1.0, 2.5, dt)
+    if mode != Mode.ROLLS:
+        g_factor = settle(g_factor, 1.0, 2.5, dt)
 
     # ===============================
     # HEADING DYNAMICS (REALISTIC)
     # ===============================
     if abs(roll) > 1.0 and airspeed > 30:
-        turn_rate = (1091 * np.tan(np.radians(roll))) / max(airspeed, 1)
-        heading = (heading + turn_rate * dt) % 360
+        turn_rate = (1091.0 * math.tan(math.radians(roll))) / max(airspeed, 1.0)
+        heading = (heading + turn_rate * dt) % 360.0
+
+    return mode, roll, pitch, vspeed, altitude, airspeed, heading, g_factor
+
+_text_cache = {}
+
+def cached_render(key, text, color):
+    # Re-render a readout only when its text or color actually changes
+    cached = _text_cache.get(key)
+    if cached is None or cached[0] != (text, color):
+        cached = ((text, color), font.render(text, True, color).convert_alpha())
+        _text_cache[key] = cached
+    return cached[1]
+
+# ===============================
+# MAIN LOOP
+# ===============================
+running = True
+accumulator = 0.0
+next_render = 0.0
+g_load_rect = None
+while running:
+    accumulator += min(clock.tick(PFD.update_fps) / 1000, MAX_FRAME_DT)
+    sim_time = time() - t0
+
+    # ---------------------------
+    # EVENTS
+    # ---------------------------
+    for event in pygame.event.get((pygame.QUIT, pygame.MOUSEBUTTONDOWN)):
+        if event.type == pygame.QUIT:
+            running = False
+
+        else:
+            hit = pygame.Rect(event.pos, (1, 1)).collidelist(click_rects)
+            if hit < 0:
+                continue
+            target = CLICK_TARGETS[hit]
+
+            # Flight mode buttons
+            if target in buttons:
+                prev_mode = mode
+                mode = MODE_BY_NAME[target]
+
+            # ALT knob
+            elif target == "ALT_UP":
+                ALTITUDE_CMD += 100
+                if mode == Mode.CRUISE:
+                    mode = Mode.CLIMB
+            elif target == "ALT_DN":
+                ALTITUDE_CMD -= 100
+                if mode == Mode.CRUISE:
+                    mode = Mode.DESCENT
+
+            # IAS knob
+            elif target == "IAS_UP":
+                IAS_CMD += 5
+            elif target == "IAS_DN":
+                IAS_CMD -= 5
+
+            # TURN knob
+            elif target == "TURN_UP":
+                if bank_idx < len(BANK_OPTIONS) - 1:
+                    bank_idx += 1
+                    bank_angle = BANK_OPTIONS[bank_idx]
+            elif target == "TURN_DN":
+                if bank_idx > 0:
+                    bank_idx -= 1
+                    bank_angle = BANK_OPTIONS[bank_idx]
+
+    # ===============================
+    # FLIGHT DYNAMICS
+    # ===============================
+    while accumulator >= FIXED_DT:
+        mode, roll, pitch, vspeed, altitude, airspeed, heading, g_factor = step_dynamics(
+            mode, roll, pitch, vspeed, altitude, airspeed, heading, g_factor,
+            IAS_CMD, ALTITUDE_CMD, bank_angle, FIXED_DT
+        )
+        accumulator -= FIXED_DT
+
+    # Skip rendering until the next display frame is due. Renders follow a
+    # deadline schedule so tick() granularity cannot drop the effective rate.
+    if PFD.render_fps is not None:
+        now = time()
+        if now < next_render:
+            continue
+        next_render += 1.0 / PFD.render_fps
+        if next_render < now:
+            # fell behind (e.g. a stall), re-sync instead of bursting
+            next_render = now + 1.0 / PFD.render_fps
 
     # ===============================
     # AIRCRAFT STATE
     # ===============================
-    state = AircraftState(
-        pitch=pitch,
-        roll=roll,
-        airspeed=airspeed,
-        airspeed_cmd=IAS_CMD,
-        vspeed=vspeed,
-        altitude=altitude,
-        altitude_cmd=ALTITUDE_CMD,
-        heading=heading,
-        heading_cmd=None,
-        course=heading
-    )
+    state.pitch = pitch
+    state.roll = roll
+    state.airspeed = airspeed
+    state.airspeed_cmd = IAS_CMD
+    state.vspeed = vspeed
+    state.altitude = altitude
+    state.altitude_cmd = ALTITUDE_CMD
+    state.heading = heading
+    state.course = heading
 
     # ===============================
     # DRAW EVERYTHING
     # ===============================
-    screen.fill((0, 0, 0))  # Clear screen
-
-    # Draw PFD
-    # Draw PFD
+    # Draw PFD (only the regions it actually redrew)
     PFD.tick()
     PFD.update(state, real_time=sim_time)
-    PFD.draw()
-    screen.blit(PFD.get_surface(), (0, 0))
+    for pfd_rect in PFD.draw():
+        screen.blit(PFD.get_surface(), pfd_rect, pfd_rect)
 
+    # Restore the PFD pixels under last frame's G LOAD readout
+    if g_load_rect is not None:
+        screen.blit(PFD.get_surface(), g_load_rect, g_load_rect)
+        g_load_rect = None
 
-    # Draw side panel
-    panel = pygame.Rect(PFD_WIDTH, 0, PANEL_WIDTH, SCREEN_HEIGHT)
-    pygame.draw.rect(screen, (28, 28, 28), panel)
 
-    # Flight Modes Title
-    screen.blit(font.render("        FLIGHT MODES      ", True, (255, 255, 255)),
-                (PFD_WIDTH + 80, 50))
+    # Draw side panel (title and knobs are pre-composited)
+    screen.blit(panel_bg, (PFD_WIDTH, 0))
 
     # Flight Mode Buttons
     for m, rect in buttons.items():
-        color = (255, 180, 0) if m == mode else (80, 80, 80)
+        color = (255, 180, 0) if MODE_BY_NAME[m] == mode else (80, 80, 80)
         pygame.draw.rect(screen, color, rect, border_radius=10)
-        text_surf = font.render(m, True, (0, 0, 0))
-        text_rect = text_surf.get_rect(center=rect.center)
-        screen.blit(text_surf, text_rect)
-
-    # ALT Knob
-    pygame.draw.rect(screen, (0,200,0), ALT_UP, border_radius=8)
-    pygame.draw.rect(screen, (220,50,50), ALT_DN, border_radius=8)
-    screen.blit(font.render("ALT +100", True, (0, 0, 0)), ALT_UP.move(5, 10))
-    screen.blit(font.render("ALT -100", True, (0, 0, 0)), ALT_DN.move(5, 10))
-
-    # IAS Knob
-    pygame.draw.rect(screen, (0,200,0), IAS_UP, border_radius=8)
-    pygame.draw.rect(screen, (220,50,50), IAS_DN, border_radius=8)
-    screen.blit(font.render("IAS +5", True, (0, 0, 0)), IAS_UP.move(5, 10))
-    screen.blit(font.render("IAS -5", True, (0, 0, 0)), IAS_DN.move(5, 10))
-
-    # Turn Knob
-    pygame.draw.rect(screen, (0,200,0), TURN_UP, border_radius=8)
-    pygame.draw.rect(screen, (220,50,50), TURN_DN, border_radius=8)
-    screen.blit(font.render("TURN +", True, (0,0,0)), TURN_UP.move(10,10))
-    screen.blit(font.render("TURN -", True, (0,0,0)), TURN_DN.move(10,10))
+        screen.blit(mode_labels[m], mode_label_positions[m])
 
     # Readouts
-    screen.blit(font.render(f"     SEL ALT => {int(ALTITUDE_CMD)} ft", True, (255, 255, 255)),
+    screen.blit(cached_render("sel_alt", f"     SEL ALT => {int(ALTITUDE_CMD)} ft", (255, 255, 255)),
                 (PFD_WIDTH + 90, 420))
-    screen.blit(font.render(f"     SEL IAS => {int(IAS_CMD)} kt", True, (255, 255, 255)),
+    screen.blit(cached_render("sel_ias", f"     SEL IAS => {int(IAS_CMD)} kt", (255, 255, 255)),
                 (PFD_WIDTH + 90, 520))
-    screen.blit(font.render(f"     BANK ANGLE : {bank_angle}°", True, (255,255,255)),
+    screen.blit(cached_render("bank_angle", f"     BANK ANGLE : {bank_angle}°", (255,255,255)),
                 (PFD_WIDTH + 90, 625))
     
     # G LOAD (TOP LEFT)
-    if mode == "ROLLS":
+    if mode == Mode.ROLLS:
         if g_factor >= 2.0:
             g_color = (255, 0, 0)       # Red warning
         elif g_factor >= 1.5:
@@ -277,8 +409,8 @@ while running:
         else:
             g_color = (0, 255, 0)       # Green normal
 
-        screen.blit(
-        font.render(f"G LOAD: {g_factor:.2f} G", True, g_color),
+        g_load_rect = screen.blit(
+        cached_render("g_load", f"G LOAD: {g_factor:.2f} G", g_color),
         (20, 70)
         )
 
@@ -100,7 +100,7 @@ class AltitudeIndicator:
         x = self.background_rect.x - self.box_size * 0.33 - 5
         y = self.background_rect.y - 38 - 5
         w = self.width + self.box_size * 0.67 + 10
-        h = self.height + 38 + 10
+        h = self.height + 38 + self.box_size / 2 + 10  # command mark can overhang the bottom
         self.render_rect = pygame.Rect(x, y, w, h)
 
     @staticmethod
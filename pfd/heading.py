@@ -97,7 +97,7 @@ class HeadingIndicator:
         ### render rectangle
         x = self.background_rect.x - 38 * 2 - 5
         y = self.background_rect.y - self.height / 3 - 5
-        w = self.width + 38 * 2 + 10
+        w = self.width + 38 * 2 + self.height / 3 + 10  # command mark can overhang the right edge
         h = self.height + self.height / 3 + 10
         self.render_rect = pygame.Rect(x, y, w, h)
 
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 
 import pygame
+import pygame.freetype
 
 from .airspeed import AirspeedIndicator
 from .airspeed_little import AirspeedIndicatorLittle
@@ -19,6 +20,11 @@ from .vspeed_little import VerticalSpeedIndicatoLittle
 # ===============================
 @dataclass
 class AircraftState:
+    __slots__ = (
+        "roll", "pitch", "airspeed", "airspeed_cmd", "altitude",
+        "altitude_cmd", "vspeed", "heading", "heading_cmd", "course",
+    )
+
     roll: float
     pitch: float
     airspeed: float
@@ -37,11 +43,14 @@ class AircraftState:
 class PrimaryFlightDisplay:
     def __init__(self, resolution: tuple, **kwargs) -> None:
         self.resolution = resolution
-        self.surface = pygame.Surface(resolution)
+        # match the display pixel format so blitting to the screen is a plain copy
+        self.surface = pygame.Surface(resolution).convert()
         self.surface_rect = self.surface.get_rect()
 
         self.game_clock = pygame.time.Clock()
         self.max_fps = kwargs.get("max_fps", None)
+        self.update_fps = kwargs.get("update_fps", 120)
+        self.render_fps = kwargs.get("render_fps", self.max_fps)
         self.fps = 0.0
 
         self.size = min(self.resolution)
@@ -105,8 +114,51 @@ class PrimaryFlightDisplay:
             )
 
         self.text_color = (255, 255, 255)
+        # freetype render_to draws glyphs straight into the surface, so the
+        # HUD text does not allocate a new Surface every frame
+        pygame.freetype.init()
+        self._hud_font = pygame.freetype.SysFont(None, 16)
         self.real_time = None
         self.sim_time = None
+        # (centiseconds, formatted text) of the last drawn clock readouts
+        self._rt_cache = (None, None)
+        self._st_cache = (None, None)
+
+        # ---------------------------
+        # DIRTY TRACKING
+        # ---------------------------
+        # tape/heading instruments in draw order; the horizon is handled apart
+        # because it paints the whole surface underneath them
+        self._instruments = [
+            self.airspeed_indicator,
+            self.vspeed_indicator,
+            self.altitude_indicator,
+            self.heading_indicator,
+        ]
+        # each instrument's draw() returns the (fixed) area it paints
+        self._instrument_rects = {
+            instrument: pygame.Rect(instrument.draw()).clip(self.surface_rect)
+            for instrument in self._instruments
+        }
+        # horizon pixels under each instrument, saved on every full redraw
+        # into surfaces allocated once here
+        self._horizon_patches = {
+            instrument: pygame.Surface(rect.size).convert()
+            for instrument, rect in self._instrument_rects.items()
+        }
+        self._last_quant = {}
+        # first draw is always a full redraw
+        self._dirty_instruments = {self.artifical_horizon}
+        # the debug axis is only cleared by a full redraw
+        self._last_debug = False
+        # background under each HUD readout, preallocated for a worst-case string
+        self._hud_patches = {
+            "fps": self._make_hud_patch((12, 13), "FPS: 9999"),
+            "real_time": self._make_hud_patch((12, 37), "TIME: 99 days, 23:59:59.99"),
+            "sim_time": self._make_hud_patch((12, 61), "SIM: 99 days, 23:59:59.99"),
+        }
+        # HUD readouts drawn last frame
+        self._hud_drawn = []
 
     # ===============================
     # UPDATE
@@ -121,52 +173,115 @@ class PrimaryFlightDisplay:
         self.real_time = real_time
         self.sim_time = sim_time
 
+        self._mark_dirty(self.artifical_horizon, (round(state.pitch * 4), round(state.roll * 4)))
+        self._mark_dirty(self.airspeed_indicator, (round(state.airspeed * 4), state.airspeed_cmd))
+        self._mark_dirty(self.altitude_indicator, (round(state.altitude), state.altitude_cmd))
+        self._mark_dirty(self.vspeed_indicator, round(state.vspeed / 10))
+        self._mark_dirty(
+            self.heading_indicator,
+            (round(state.heading * 8), round(state.course * 8), state.heading_cmd),
+        )
+
+    def _mark_dirty(self, instrument, quantized) -> None:
+        # only redraw an instrument when its value moved by about a pixel
+        if self._last_quant.get(instrument) != quantized:
+            self._last_quant[instrument] = quantized
+            self._dirty_instruments.add(instrument)
+
     # ===============================
     # DRAW
     # ===============================
-    def draw(self, debug: bool = False) -> None:
+    def draw(self, debug: bool = False) -> list:
+        full_redraw = debug or self._last_debug or self.artifical_horizon in self._dirty_instruments
+        self._last_debug = debug
+        if full_redraw:
+            dirty_rects = [self._draw_instruments(debug)]
+        else:
+            # erase the previous text overlay
+            dirty_rects = []
+            for key in reversed(self._hud_drawn):
+                patch, rect = self._hud_patches[key]
+                self.surface.blit(patch, rect)
+                dirty_rects.append(rect)
+            for instrument in self._dirty_instruments:
+                dirty_rects.append(self._redraw_instrument(instrument))
+            self._dirty_instruments.clear()
+
+        self._hud_drawn = []
+        self._draw_fps()
+        if self.real_time is not None:
+            self._draw_real_time()
+        if self.sim_time is not None:
+            self._draw_sim_time()
+
+        if not full_redraw:
+            for key in self._hud_drawn:
+                rect = self._hud_patches[key][1]
+                if rect not in dirty_rects:
+                    dirty_rects.append(rect)
+        return dirty_rects
+
+    def _draw_instruments(self, debug: bool = False) -> pygame.Rect:
         self.surface.fill((0, 0, 0))
 
         self.artifical_horizon.draw()
-        self.airspeed_indicator.draw()
-        self.vspeed_indicator.draw()
-        self.altitude_indicator.draw()
-        self.heading_indicator.draw()
+        for instrument, rect in self._instrument_rects.items():
+            self._horizon_patches[instrument].blit(self.surface, (0, 0), rect)
+        for instrument in self._instruments:
+            instrument.draw()
 
         if debug:
             self.artifical_horizon.draw_aux_axis()
 
-        self._draw_fps()
-        if self.real_time is not None:
-            self._draw_real_time()
-        if self.sim_time is not None:
-            self._draw_sim_time()
+        self._dirty_instruments.clear()
+        return self.surface_rect
+
+    def _redraw_instrument(self, instrument) -> pygame.Rect:
+        # restore the horizon under the instrument, then repaint everything
+        # overlapping its area (neighbouring instruments may share edges)
+        rect = self._instrument_rects[instrument]
+        self.surface.blit(self._horizon_patches[instrument], rect)
+        self.surface.set_clip(rect)
+        for other in self._instruments:
+            if self._instrument_rects[other].colliderect(rect):
+                other.draw()
+        self.surface.set_clip(None)
+        return rect
 
     # ===============================
     # TEXT
     # ===============================
+    def _make_hud_patch(self, position: tuple, text: str) -> tuple:
+        rect = pygame.Rect(position, self._hud_font.get_rect(text).size).clip(self.surface_rect)
+        return pygame.Surface(rect.size).convert(), rect
+
+    def _draw_hud_text(self, key: str, text: str) -> None:
+        # save the background first so the next frame can erase the text
+        patch, rect = self._hud_patches[key]
+        patch.blit(self.surface, (0, 0), rect)
+        drawn = self._hud_font.render_to(self.surface, rect.topleft, text, self.text_color)
+        self._hud_drawn.append(key)
+
+        if not rect.contains(drawn.clip(self.surface_rect)):
+            # longer than the preallocated worst case: grow the patch and
+            # repaint everything next frame to clear the overflow
+            self._hud_patches[key] = self._make_hud_patch(rect.topleft, text)
+            self._dirty_instruments.add(self.artifical_horizon)
+
     def _draw_fps(self):
-        font = pygame.font.SysFont(None, 24)
-        txt = font.render(f"FPS: {self.fps:.0f}", True, self.text_color)
-        self.surface.blit(txt, (12, 12))
+        self._draw_hud_text("fps", f"FPS: {self.fps:.0f}")
 
     def _draw_real_time(self):
-        font = pygame.font.SysFont(None, 24)
-        txt = font.render(
-            "TIME: " + str(timedelta(seconds=self.real_time))[:-4],
-            True,
-            self.text_color,
-        )
-        self.surface.blit(txt, (12, 36))
+        k = int(self.real_time * 100)
+        if k != self._rt_cache[0]:
+            self._rt_cache = (k, "TIME: " + str(timedelta(seconds=self.real_time))[:-4])
+        self._draw_hud_text("real_time", self._rt_cache[1])
 
     def _draw_sim_time(self):
-        font = pygame.font.SysFont(None, 24)
-        txt = font.render(
-            "SIM: " + str(timedelta(seconds=self.sim_time))[:-4],
-            True,
-            self.text_color,
-        )
-        self.surface.blit(txt, (12, 60))
+        k = int(self.sim_time * 100)
+        if k != self._st_cache[0]:
+            self._st_cache = (k, "SIM: " + str(timedelta(seconds=self.sim_time))[:-4])
+        self._draw_hud_text("sim_time", self._st_cache[1])
 
     # ===============================
     # FPS UPDATE
@@ -0,0 +1,26 @@
+from setuptools import find_packages, setup
+
+# Optional ahead-of-time compilation of the pfd modules with Cython
+# (pure-Python mode, no source changes). Build in place with:
+#     python setup.py build_ext --inplace
+# The compiled extensions shadow the .py files; without Cython, or if the
+# extensions are not built, the plain Python package is used.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["pfd/*.py"],
+        exclude=["pfd/__init__.py"],
+        compiler_directives={"language_level": "3"},
+        quiet=True,
+    )
+
+setup(
+    name="pfd",
+    version="0.1.0",
+    packages=find_packages(include=["pfd"]),
+    install_requires=["numpy", "pygame"],
+    ext_modules=ext_modules,
+)